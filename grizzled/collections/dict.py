@@ -38,6 +38,10 @@ __all__ = ['LRUDict']
 
 class LRUListEntry(object):
 
+    # An LRUDict allocates one of these per key, so avoid a per-instance
+    # __dict__.
+    __slots__ = ('key', 'value', 'next', 'prev')
+
     def __init__(self, key, value):
         self.key = key
         self.value = value
@@ -55,8 +59,15 @@ class LRUListEntry(object):
 
 class LRUList(object):
 
+    # The list is circular, anchored by a sentinel entry: the sentinel's
+    # "next" is the head (most recently used) and its "prev" is the tail
+    # (least recently used). Every real entry therefore always has live
+    # neighbors, so linking and unlinking never need to special-case the
+    # ends of the list.
+
     def __init__(self):
-        self.head = self.tail = None
+        self._sentinel = LRUListEntry(None, None)
+        self._sentinel.next = self._sentinel.prev = self._sentinel
         self.size = 0
 
     def __del__(self):
@@ -72,65 +83,63 @@ class LRUList(object):
         return self.size
 
     def __iter__(self):
-        entry = self.head
-        while entry:
+        sentinel = self._sentinel
+        entry = sentinel.next
+        while entry is not sentinel:
             yield entry.key
             entry = entry.next
 
+    @property
+    def head(self):
+        entry = self._sentinel.next
+        return None if entry is self._sentinel else entry
+
+    @property
+    def tail(self):
+        entry = self._sentinel.prev
+        return None if entry is self._sentinel else entry
+
     def keys(self):
         return [k for k in self]
 
     def items(self):
-        result = []
-        for key, value in self.iteritems():
-            result.append((key, value))
-        return result
+        return list(self.iteritems())
 
     def values(self):
-        result = []
-        for key, value in self.items():
-            result.append(value)
-        return result
+        return list(self.itervalues())
 
     def iteritems(self):
-        entry = self.head
-        while entry:
+        sentinel = self._sentinel
+        entry = sentinel.next
+        while entry is not sentinel:
             yield (entry.key, entry.value)
             entry = entry.next
 
     def iterkeys(self):
-        self.__iter__()
+        return self.__iter__()
 
     def itervalues(self):
-        entry = self.head
-        while entry:
+        sentinel = self._sentinel
+        entry = sentinel.next
+        while entry is not sentinel:
             yield entry.value
             entry = entry.next
 
     def clear(self):
-        while self.head:
-            cur = self.head
-            next = self.head.next
-            cur.next = cur.previous = cur.key = cur.value = None
-            self.head = next
-
-        self.tail = None
+        sentinel = self._sentinel
+        entry = sentinel.next
+        while entry is not sentinel:
+            next = entry.next
+            entry.next = entry.prev = entry.key = entry.value = None
+            entry = next
+
+        sentinel.next = sentinel.prev = sentinel
         self.size = 0
 
     def remove(self, entry):
-        if entry.next:
-            entry.next.previous = entry.previous
-
-        if entry.previous:
-            entry.previous.next = entry.next
-
-        if entry == self.head:
-            self.head = entry.next
-
-        if entry == self.tail:
-            self.tail = entry.previous
-
-        entry.next = entry.previous = None
+        entry.prev.next = entry.next
+        entry.next.prev = entry.prev
+        entry.next = entry.prev = None
         self.size -= 1
         assert self.size >= 0
 
@@ -146,24 +155,27 @@ class LRUList(object):
         if type(entry) == tuple:
             key, value = entry
             entry = LRUListEntry(key, value)
-        else:
-            entry.next = entry.previous = None
-
-        if self.head:
-            assert self.tail
-            entry.next = self.head
-            self.head.previous = entry
-            self.head = entry
-
-        else:
-            assert not self.tail
-            self.head = self.tail = entry
 
+        sentinel = self._sentinel
+        entry.prev = sentinel
+        entry.next = sentinel.next
+        sentinel.next.prev = entry
+        sentinel.next = entry
         self.size += 1
 
     def move_to_head(self, entry):
-        self.remove(entry)
-        self.add_to_head(entry)
+        sentinel = self._sentinel
+        if sentinel.next is entry:
+            return
+
+        # Unlink, then splice back in right after the sentinel. The size
+        # doesn't change.
+        entry.prev.next = entry.next
+        entry.next.prev = entry.prev
+        entry.prev = sentinel
+        entry.next = sentinel.next
+        sentinel.next.prev = entry
+        sentinel.next = entry
 
 class LRUDict(dict):
     """
@@ -310,7 +322,31 @@ class LRUDict(dict):
             del self.__removal_listeners[key]
 
     def __setitem__(self, key, value):
-        self.__put(key, value)
+        # This is the hot path, so it avoids a second method call and
+        # doesn't use KeyError for the (common) insertion case.
+        lru_entry = dict.get(self, key)
+        if lru_entry is not None:
+            # Replacing an existing value with a new one. Move the entry
+            # to the head of the list. The dictionary already maps the key
+            # to the entry.
+            lru_entry.value = value
+            self.__lru_queue.move_to_head(lru_entry)
+            return
+
+        # Not there. Have to add a new one. Clear out the cruft first, if
+        # the dictionary is full. Preserve one of the entries we're clearing,
+        # to avoid reallocation.
+        lru_entry = None
+        if len(self.__lru_queue) >= self.__max_capacity:
+            lru_entry = self._clear_to(self.__max_capacity - 1)
+
+        if lru_entry:
+            lru_entry.key, lru_entry.value = key, value
+        else:
+            lru_entry = LRUListEntry(key, value)
+
+        self.__lru_queue.add_to_head(lru_entry)
+        dict.__setitem__(self, key, lru_entry)
 
     def __getitem__(self, key):
         lru_entry = dict.__getitem__(self, key)
@@ -453,38 +489,14 @@ class LRUDict(dict):
         dict.__delitem__(self, lru_entry.key)
         return lru_entry.key, lru_entry.value
 
-    def __put(self, key: Any, value: Any):
-        try:
-            lru_entry = dict.__getitem__(self, key)
-
-            # Replacing an existing value with a new one. Move the entry
-            # to the head of the list.
-
-            lru_entry.value = value
-            self.__lru_queue.move_to_head(lru_entry)
-
-        except KeyError:
-            # Not there. Have to add a new one. Clear out the cruft first.
-            # Preserve one of the entries we're clearing, to avoid
-            # reallocation.
-
-            lru_entry = self._clear_to(self.max_capacity - 1)
-            if lru_entry:
-                lru_entry.key, lru_entry.value = key, value
-            else:
-                lru_entry = LRUListEntry(key, value)
-            self.__lru_queue.add_to_head(lru_entry)
-
-        dict.__setitem__(self, key, lru_entry)
-
     def _clear_to(self, size):
         old_tail = None
         while len(self.__lru_queue) > size:
             old_tail = self.__lru_queue.remove_tail()
             assert old_tail
             key = old_tail.key
-            value = dict.__delitem__(self, key)
-            self._notify_listeners(True, [(key, value)])
+            dict.__delitem__(self, key)
+            self._notify_listeners(True, [(key, old_tail.value)])
 
         assert len(self.__lru_queue) <= size
         assert len(self) == len(self.__lru_queue)
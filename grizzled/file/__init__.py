@@ -10,8 +10,9 @@ __docformat__ = "markdown"
 
 import os as _os
 import shutil
+import stat as _stat
 from typing import (Sequence, Mapping, Any, Optional, Union, NoReturn,
-                    Generator, Tuple)
+                    Generator, Tuple, Callable)
 
 # ---------------------------------------------------------------------------
 # Exports
@@ -21,6 +22,14 @@ __all__ = ['unlink_quietly', 'recursively_remove', 'copy', 'touch',
            'pathsplit', 'eglob', 'universal_path', 'native_path',
            'list_recursively', 'includer']
 
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+# Flags touch() uses to create a missing file.
+_TOUCH_CREATE_FLAGS = (_os.O_WRONLY | _os.O_CREAT |
+                       getattr(_os, 'O_NOCTTY', 0))
+
 # ---------------------------------------------------------------------------
 # Functions
 # ---------------------------------------------------------------------------
@@ -71,8 +80,7 @@ def list_recursively(dir: str, *,
     """
     Recursively list the contents of a directory. Yields the contents of
     the directory and all subdirectories. This method returns a generator,
-    so it evaluates its recursive walk lazily. This function is just a
-    simple wrapper around `os.walk`.
+    so it evaluates its recursive walk lazily.
 
     Each yielded value is a partial path, relative to the original directory.
 
@@ -96,16 +104,13 @@ def list_recursively(dir: str, *,
     if not _os.path.isdir(dir):
         raise ValueError("{0} is not a directory.".format(dir))
 
-    from grizzled.os import working_directory
-
-    with working_directory(dir):
-        for dirpath, dirnames, filenames in _os.walk('.'):
-            if include_dirs:
-                for d in dirnames:
-                    yield _os.path.normpath(_os.path.join(dirpath, d))
-            if include_files:
-                for f in filenames:
-                    yield _os.path.normpath(_os.path.join(dirpath, f))
+    for dirpath, dirnames, filenames in _walk(dir):
+        if include_dirs:
+            for d in dirnames:
+                yield _os.path.join(dirpath, d)
+        if include_files:
+            for f in filenames:
+                yield _os.path.join(dirpath, f)
 
 
 def copy(files : Union[Sequence[str], str],
@@ -175,18 +180,22 @@ def touch(files: Union[str, Sequence[str]], *,
     if (times is not None) and (ns is not None):
         raise ValueError("Can't specify both ns and times.")
 
+    stat = _os.stat
+    utime = _os.utime
     for f in files:
-        if _os.path.exists(f):
-            if not _os.path.isfile(f):
-                raise OSError('Cannot touch non-file "{0}"'.format(f))
-            if ns:
-                _os.utime(f, times=None, ns=ns)
-            else:
-                _os.utime(f, times)
+        try:
+            mode = stat(f).st_mode
+        except FileNotFoundError:
+            # Doesn't exist. Create it.
+            _os.close(_os.open(f, _TOUCH_CREATE_FLAGS, 0o666))
+            continue
 
+        if not _stat.S_ISREG(mode):
+            raise OSError('Cannot touch non-file "{0}"'.format(f))
+        if ns:
+            utime(f, times=None, ns=ns)
         else:
-            # Doesn't exist. Create it.
-            open(f, 'wb').close()
+            utime(f, times)
 
 
 def pathsplit(path: str) -> Sequence[str]:
@@ -219,6 +228,79 @@ def pathsplit(path: str) -> Sequence[str]:
 
     return result
 
+def _walk(directory: str) -> Generator[Tuple[str, Sequence[str],
+                                            Sequence[str]], None, None]:
+    """
+    Used by eglob and list_recursively. Like `os.walk(directory)` (top-down,
+    not following symbolic links to directories, ignoring unreadable
+    directories), except that each yielded directory path is relative to
+    `directory` (`''` for `directory` itself). It uses `os.scandir()`
+    directly, so each entry is classified from its cached `DirEntry` and
+    nothing needs to be stat'd twice.
+    """
+    pending = ['']
+    while pending:
+        dirpath = pending.pop()
+        dirnames = []
+        filenames = []
+        subdirs = []
+        try:
+            with _os.scandir(_os.path.join(directory, dirpath)) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                        walk_into = is_dir and (not entry.is_symlink())
+                    except OSError:
+                        is_dir = walk_into = False
+
+                    if is_dir:
+                        dirnames.append(entry.name)
+                    else:
+                        filenames.append(entry.name)
+
+                    if walk_into:
+                        subdirs.append(_os.path.join(dirpath, entry.name))
+        except OSError:
+            continue
+
+        yield dirpath, dirnames, filenames
+
+        # Visit subdirectories in order, depth-first, as os.walk() does.
+        pending.extend(reversed(subdirs))
+
+def _has_glob_magic(s: str) -> bool:
+    return ('*' in s) or ('?' in s) or ('[' in s)
+
+def _basename_matcher(pattern: str) -> Optional[Callable[[str], bool]]:
+    """
+    Used by eglob. Lowers a simple wildcard pattern (`*suffix`, `prefix*` or
+    `*infix*`) to a plain string test that agrees with what `fnmatch`, and
+    hence the standard `glob` module, would match. Returns `None` if the
+    pattern is more complicated than that, or if `fnmatch` ignores case on
+    this system (e.g., Windows); the caller must then fall back to `glob`.
+    """
+    if _os.path.normcase('A') != 'A':
+        return None
+
+    # Like glob, don't let a leading wildcard match a leading ".".
+    if pattern.startswith('*') and pattern.endswith('*') and len(pattern) > 2:
+        infix = pattern[1:-1]
+        if not _has_glob_magic(infix):
+            return lambda name: (infix in name) and (not name.startswith('.'))
+
+    elif pattern.startswith('*') and len(pattern) > 1:
+        suffix = pattern[1:]
+        if not _has_glob_magic(suffix):
+            return lambda name: (name.endswith(suffix) and
+                                 (not name.startswith('.')))
+
+    elif pattern.endswith('*') and len(pattern) > 1:
+        prefix = pattern[:-1]
+        if not _has_glob_magic(prefix):
+            return lambda name: name.startswith(prefix)
+
+    return None
+
 def _find_matches(pattern_pieces: Sequence[str],
                   directory: str) -> Generator[str, str, None]:
     """
@@ -233,11 +315,33 @@ def _find_matches(pattern_pieces: Sequence[str],
     last = len(pattern_pieces) == 1
     remaining_pieces = []
     if piece == '**':
+        literal = None
+        matches = None
         if not last:
             remaining_pieces = pattern_pieces[1:]
-
-        for root, dirs, files in _os.walk(directory):
-            if last:
+            if len(remaining_pieces) == 1:
+                name = remaining_pieces[0]
+                if _has_glob_magic(name):
+                    matches = _basename_matcher(name)
+                else:
+                    literal = name
+
+        for dirpath, dirs, files in _walk(directory):
+            root = _os.path.join(directory, dirpath)
+            if literal:
+                # "**/name", with no wildcards: Like glob, just check whether
+                # the name exists, so that case-insensitive file systems
+                # (e.g., the macOS default) still match it.
+                path = _os.path.join(root, literal)
+                if _os.path.lexists(path):
+                    yield _os.path.normpath(path)
+            elif matches:
+                # "**/name": Just test the names the walk already found,
+                # rather than globbing each directory again.
+                for name in dirs + files:
+                    if matches(name):
+                        yield _os.path.normpath(_os.path.join(root, name))
+            elif last:
                 # At the end of a pattern, "**" just recursively matches
                 # directories.
                 yield _os.path.normpath(root)
@@ -72,18 +72,28 @@ import sys
 import re
 import tempfile
 import atexit
-import codecs
 
 from grizzled.file import unlink_quietly
 
 from typing import (Union, Sequence, AnyStr, TextIO, Optional, Iterable, List,
-                    Tuple, Any)
+                    Any)
 
 
 __docformat__ = "markdown"
 
 __all__ = ['Includer', 'IncludeError', 'preprocess', 'MaxNestingExceededError']
 
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+# The default include directive syntax. It's compiled once, here, and lines
+# that don't contain the directive keyword at all skip the regular
+# expression entirely.
+_DEFAULT_INCLUDE_REGEX = r'^%include\s"([^"]+)"'
+_DEFAULT_INCLUDE_PATTERN = re.compile(_DEFAULT_INCLUDE_REGEX)
+_DEFAULT_INCLUDE_KEYWORD = '%include'
+
 # ---------------------------------------------------------------------------
 # Logging
 # ---------------------------------------------------------------------------
@@ -131,7 +141,7 @@ class Includer(object):
     """
     def __init__(self,
                  source: Union[TextIO, AnyStr],
-                 include_regex: AnyStr = '^%include\s"([^"]+)"',
+                 include_regex: AnyStr = _DEFAULT_INCLUDE_REGEX,
                  max_nest_level: int = 100,
                  output: Optional[Union[TextIO, AnyStr]] = None,
                  encoding: str = 'utf-8'):
@@ -158,8 +168,10 @@ class Includer(object):
         """
 
         self._encoding = encoding
-        if isinstance(source, str):
-            f, name = self._open(source, None)
+        opened = isinstance(source, str)
+        if opened:
+            name = self._resolve_path(source, None)
+            f = self._open(name)
         else:
             # Assume file-like object.
             f = source
@@ -170,7 +182,12 @@ class Includer(object):
 
         self.closed = False
         self.mode = None
-        self._include_pattern = re.compile(include_regex)
+        if include_regex == _DEFAULT_INCLUDE_REGEX:
+            self._include_pattern = _DEFAULT_INCLUDE_PATTERN
+            self._include_keyword = _DEFAULT_INCLUDE_KEYWORD
+        else:
+            self._include_pattern = re.compile(include_regex)
+            self._include_keyword = None
         self._name = name
 
         if output == None:
@@ -178,8 +195,11 @@ class Includer(object):
             output = StringIO()
 
         self._maxnest = max_nest_level
-        self._nested = 0
-        self._process_includes(f, name, output)
+        try:
+            self._process_includes(f, name, output)
+        finally:
+            if opened:
+                f.close()
         self._f = output
         self._f.seek(0)
 
@@ -310,29 +330,51 @@ class Includer(object):
                           file_in: TextIO,
                           filename: str,
                           file_out: TextIO) -> None:
+        # Rather than recursing for each include, keep a stack of line
+        # iterators. The top of the stack is the innermost include; the
+        # bottom is file_in.
+        #
+        # Each included file is read just once per expansion, however many
+        # times it's included: its lines are cached by path, and repeated
+        # includes replay the cached lines.
         log.debug(f'Processing includes in "{filename}"')
+        pattern = self._include_pattern
+        keyword = self._include_keyword
+        included_lines = {}
+        stack = [(iter(file_in), filename)]
+        while stack:
+            lines, name = stack[-1]
+            line = next(lines, None)
+            if line is None:
+                stack.pop()
+                continue
+
+            match = None
+            if (keyword is None) or (keyword in line):
+                match = pattern.search(line)
 
-        for line in file_in:
-            match = self._include_pattern.search(line)
             if match:
-                if self._nested >= self._maxnest:
+                if len(stack) > self._maxnest:
                     raise MaxNestingExceededError(
                         f'Exceeded maximum include depth of {self._maxnest}'
                     )
 
-                inc_name = match.group(1)
                 log.debug(f'Found include directive: {line[:-1]}')
-                f, included_name = self._open(inc_name, filename)
-                self._nested += 1
-                self._process_includes(f, filename, file_out)
-                self._nested -= 1
+                inc_path = self._resolve_path(match.group(1), name)
+                inc_lines = included_lines.get(inc_path)
+                if inc_lines is None:
+                    log.debug(f'Processing includes in "{inc_path}"')
+                    with self._open(inc_path) as f:
+                        inc_lines = f.readlines()
+                    included_lines[inc_path] = inc_lines
+
+                stack.append((iter(inc_lines), inc_path))
             else:
                 file_out.write(line)
 
-    def _open(self,
-              name_to_open: str,
-              enclosing_file: Optional[str]) -> Tuple[TextIO, str]:
-
+    def _resolve_path(self,
+                      name_to_open: str,
+                      enclosing_file: Optional[str]) -> str:
         if not os.path.isabs(name_to_open):
             # Not an absolute file. Base it on the parent.
             if enclosing_file == None:
@@ -342,14 +384,16 @@ class Includer(object):
 
             name_to_open = os.path.join(enclosing_dir, name_to_open)
 
+        return name_to_open
+
+    def _open(self, path: str) -> TextIO:
         try:
-            log.debug(f'Opening "{name_to_open}" with encoding {self._encoding}')
-            f = codecs.open(name_to_open, mode='r', encoding=self._encoding)
+            log.debug(f'Opening "{path}" with encoding {self._encoding}')
+            return open(path, mode='r', encoding=self._encoding, newline='')
         except:
             raise IncludeError(
-                f'Unable to open "{name_to_open}".'
+                f'Unable to open "{path}".'
             )
-        return (f, name_to_open)
 
 # ---------------------------------------------------------------------------
 # Public functions
@@ -9,6 +9,7 @@ __docformat__ = "markdown"
 # ---------------------------------------------------------------------------
 
 import os
+from collections import deque
 from typing import IO, TextIO, Union, AnyStr, NoReturn, Sequence, Iterable
 from . import filelock
 
@@ -171,7 +172,10 @@ class PushbackFile(object):
         - `f` (file-like object): A file-like object that contains both a
           `write()` method and a `flush()` method.
         """
-        self.__buf = [c for c in ''.join(f.readlines())]
+        # The unread input, as a queue of string chunks. Initially, each
+        # chunk is a line of the file, so readline() usually just pops one
+        # chunk; pushback() adds a chunk at the front.
+        self.__buf = deque(f.readlines())
 
     def write(self, buf: Union[bytes, bytearray, AnyStr]):
         """
@@ -196,7 +200,8 @@ class PushbackFile(object):
 
         `s` (`str`): the string to push back onto the input stream
         """
-        self.__buf = [c for c in s] + self.__buf
+        if s:
+            self.__buf.appendleft(s)
 
     unread=pushback
 
@@ -213,31 +218,40 @@ class PushbackFile(object):
 
         the bytes read, joined into a string
         """
-        resultBuf = None
-        if n > len(self.__buf):
-            n = len(self.__buf)
+        buf = self.__buf
+        if n < 0:
+            result = ''.join(buf)
+            buf.clear()
+            return result
 
-        if (n < 0) or (n >= len(self.__buf)):
-            resultBuf = self.__buf
-            self.__buf = []
+        chunks = []
+        while (n > 0) and buf:
+            chunk = buf.popleft()
+            if len(chunk) > n:
+                buf.appendleft(chunk[n:])
+                chunk = chunk[:n]
+            chunks.append(chunk)
+            n -= len(chunk)
 
-        else:
-            resultBuf = self.__buf[0:n]
-            self.__buf = self.__buf[n:]
-
-        return ''.join(resultBuf)
+        return ''.join(chunks)
 
     def readline(self):
         """
         Read the next line from the file.
         """
-        i = 0
-        while i < len(self.__buf) and (self.__buf[i] != '\n'):
-            i += 1
-
-        result = self.__buf[0:i+1]
-        self.__buf = self.__buf[i+1:]
-        return ''.join(result)
+        buf = self.__buf
+        chunks = []
+        while buf:
+            chunk = buf.popleft()
+            i = chunk.find('\n')
+            if i >= 0:
+                if i + 1 < len(chunk):
+                    buf.appendleft(chunk[i + 1:])
+                chunks.append(chunk[:i + 1])
+                break
+            chunks.append(chunk)
+
+        return ''.join(chunks)
 
     def readlines(self):
         """
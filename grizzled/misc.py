@@ -95,11 +95,9 @@ class ReadOnly(object):
 
 def bitcount(num: int) -> int:
     """
-    Count the number of bits in a numeric (integer or long) value. This
-    method is adapted from the Hamming Weight algorithm, described (among
-    other places) at http://en.wikipedia.org/wiki/Hamming_weight
-
-    Works for up to 64 bits.
+    Count the number of 1 bits in an integer value (its population count,
+    or Hamming weight). Works for integers of any size. For a negative
+    number, counts the 1 bits in its absolute value.
 
     **Parameters**
 
@@ -109,16 +107,12 @@ def bitcount(num: int) -> int:
 
     The number of 1 bits in the binary representation of `num`
     """
-    # Put count of each 2 bits into those 2 bits.
-    num = num - ((num >> 1) & 0x5555555555555555)
-
-    # Put count of each 4 bits into those 4 bits.
-    num = (num & 0x3333333333333333) + ((num >> 2) & 0x3333333333333333)
-
-    # Put count of each 8 bits into those 8 bits.
-    num = (num + (num >> 4)) & 0x0f0f0f0f0f0f0f0f
-
-    # Left-most bits.
-    return int((num * 0x0101010101010101) >> 56)
+    return _popcount(num)
 
+# ---------------------------------------------------------------------------
+# Private functions
+# ---------------------------------------------------------------------------
 
+# int.bit_count() is new in Python 3.10. On older versions, bin() and
+# str.count() still keep the counting out of Python bytecode.
+_popcount = getattr(int, 'bit_count', None) or (lambda n: bin(n).count('1'))
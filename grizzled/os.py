@@ -14,7 +14,6 @@ __docformat__ = "markdown"
 
 import logging
 import os as _os
-import sys
 import glob
 from contextlib import contextmanager
 from typing import Sequence, Optional, Union, NoReturn
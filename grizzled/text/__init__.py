@@ -9,9 +9,10 @@ __docformat__ = "restructuredtext en"
 # Imports
 # ---------------------------------------------------------------------------
 
+from functools import lru_cache
 from io import StringIO
-import itertools
-from typing import Union, TextIO, Optional
+import re
+from typing import Union, TextIO, Optional, Pattern
 
 # ---------------------------------------------------------------------------
 # Exports
@@ -25,6 +26,25 @@ __all__ = ['hexdump', 'strip_margin']
 
 REPEAT_FORMAT = '*** Repeated %d times'
 
+# What strip_margin() removes from the start of each line, for the default
+# margin character: leading blanks and tabs, then the margin character, if
+# it's there.
+_MARGIN_RE = re.compile(r'^[ \t]*\|?', re.MULTILINE)
+
+# The strings str2bool() accepts, case-folded, and their values.
+_BOOL_STRINGS = {'false' : False,
+                 'true'  : True,
+                 'f'     : False,
+                 't'     : True,
+                 '0'     : False,
+                 '1'     : True,
+                 'no'    : False,
+                 'yes'   : True,
+                 'n'     : False,
+                 'y'     : True,
+                 'off'   : False,
+                 'on'    : True}
+
 # ---------------------------------------------------------------------------
 # Functions
 # ---------------------------------------------------------------------------
@@ -58,14 +78,12 @@ def strip_margin(s: str, margin_char: str = '|') -> str:
     the stripped string
     """
     assert len(margin_char) == 1
-    def fix_line(line: str) -> str:
-        adj = ''.join(itertools.dropwhile(lambda c: c in [' ', '\t'], line))
-        if (len(adj) > 0) and (adj[0] == margin_char):
-            return adj[1:]
-        else:
-            return adj
+    if margin_char == '|':
+        margin_re = _MARGIN_RE
+    else:
+        margin_re = _margin_regex(margin_char)
 
-    return '\n'.join(map(fix_line, s.split('\n')))
+    return margin_re.sub('', s)
 
 
 def hexdump(source: Union[str, TextIO],
@@ -225,17 +243,19 @@ def str2bool(s):
     `ValueError`: unrecognized boolean string
     """
     try:
-        return {'false' : False,
-                'true'  : True,
-                'f'     : False,
-                't'     : True,
-                '0'     : False,
-                '1'     : True,
-                'no'    : False,
-                'yes'   : True,
-                'y'     : False,
-                'n'     : True,
-                'off'   : False,
-                'on'    : True}[s.lower()]
+        return _BOOL_STRINGS[s.casefold()]
     except KeyError:
         raise ValueError('Unrecognized boolean string: "{0}"'.format(s))
+
+# ---------------------------------------------------------------------------
+# Private functions
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=32)
+def _margin_regex(margin_char: str) -> Pattern:
+    """
+    Used by strip_margin(). Builds (once per margin character) the
+    equivalent of `_MARGIN_RE` for a non-default margin character.
+    """
+    return re.compile(r'^[ \t]*' + re.escape(margin_char) + '?',
+                      re.MULTILINE)
@@ -6,10 +6,20 @@ Tester.
 # Imports
 # ---------------------------------------------------------------------------
 
+import logging
 from timeit import Timer
 
 from grizzled.collections import LRUDict
 
+# ---------------------------------------------------------------------------
+# Logging
+# ---------------------------------------------------------------------------
+
+# The progress messages below go to a logger, rather than straight to
+# stdout, so formatting the dictionary is skipped unless debug logging is
+# enabled.
+log = logging.getLogger('test')
+
 # ---------------------------------------------------------------------------
 # Exports
 # ---------------------------------------------------------------------------
@@ -23,68 +33,68 @@ class TestLRUDict(object):
     def test_1(self):
         lru = LRUDict(max_capacity=5)
 
-        print("Adding 'a' and 'b'")
+        log.debug("Adding 'a' and 'b'")
         lru['a'] = 'A'
         lru['b'] = 'b'
-        print(lru)
-        print(list(lru.keys()))
+        log.debug('%s', lru)
+        log.debug('keys=%s', lru.keys())
         assert list(lru.keys()) == ['b', 'a']
         assert list(lru.values()) == ['b', 'A']
 
-        print("Adding 'c'")
+        log.debug("Adding 'c'")
         lru['c'] = 'c'
-        print(lru)
-        print(list(lru.keys()))
+        log.debug('%s', lru)
+        log.debug('keys=%s', lru.keys())
         assert list(lru.keys()) == ['c', 'b', 'a']
 
-        print("Updating 'a'")
+        log.debug("Updating 'a'")
         lru['a'] = 'a'
-        print(lru)
-        print(list(lru.keys()))
+        log.debug('%s', lru)
+        log.debug('keys=%s', lru.keys())
         assert list(lru.keys()) == ['a', 'c', 'b']
 
-        print("Adding 'd' and 'e'")
+        log.debug("Adding 'd' and 'e'")
         lru['d'] = 'd'
         lru['e'] = 'e'
-        print(lru)
-        print(list(lru.keys()))
+        log.debug('%s', lru)
+        log.debug('keys=%s', lru.keys())
         assert list(lru.keys()) == ['e', 'd', 'a', 'c', 'b']
 
-        print("Accessing 'b'")
+        log.debug("Accessing 'b'")
         assert lru['b'] == 'b'
-        print(lru)
-        print(list(lru.keys()))
+        log.debug('%s', lru)
+        log.debug('keys=%s', lru.keys())
         assert list(lru.keys()) == ['b', 'e', 'd', 'a', 'c']
 
-        print("Adding 'f'")
+        log.debug("Adding 'f'")
         lru['f'] = 'f'
         # Should knock 'c' out of the list
-        print(lru)
-        print(list(lru.keys()))
+        log.debug('%s', lru)
+        log.debug('keys=%s', lru.keys())
         assert list(lru.keys()) == ['f', 'b', 'e', 'd', 'a']
 
         def on_remove(key, value, the_list):
-            print('on_remove("%s")' % key)
-            the_list.append(key)
+            log.debug('on_remove("%s", "%s")', key, value)
+            the_list.append((key, value))
 
-        print('Reducing capacity. Should result in eviction.')
+        log.debug('Reducing capacity. Should result in eviction.')
         ejected = []
         lru.add_ejection_listener(on_remove, ejected)
         lru.max_capacity = 3
         ejected.sort()
-        print('ejected=%s' % ejected)
-        assert ejected == ['a', 'd']
-        print(list(lru.keys()))
+        log.debug('ejected=%s', ejected)
+        assert ejected == [('a', 'a'), ('d', 'd')]
+        log.debug('keys=%s', lru.keys())
         assert list(lru.keys()) == ['f', 'b', 'e']
 
-        print('Testing popitem()')
+        log.debug('Testing popitem()')
         key, value = lru.popitem()
-        print(lru)
-        print(list(lru.keys()))
+        log.debug('%s', lru)
+        log.debug('keys=%s', lru.keys())
         assert key == 'e'
         assert list(lru.keys()) == ['f', 'b']
 
-        print('Clearing dictionary')
+        log.debug('Clearing dictionary')
         lru.clear_listeners()
         lru.clear()
         del lru
@@ -93,12 +103,12 @@ class TestLRUDict(object):
         lru[key] = key
 
     def test_big(self):
-        print('Putting 10000 entries in a new LRU cache')
+        log.debug('Putting 10000 entries in a new LRU cache')
         lru = LRUDict(max_capacity=10000)
         for i in range(0, lru.max_capacity):
             lru[i] = i
 
         assert len(lru) == lru.max_capacity
-        print('Adding one more')
+        log.debug('Adding one more')
         assert len(lru) == lru.max_capacity
-        print(next(iter(lru)))
+        log.debug('first key=%s', next(iter(lru)))
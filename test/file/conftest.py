@@ -0,0 +1,12 @@
+from tempfile import TemporaryDirectory
+from typing import Generator
+import pytest
+
+@pytest.fixture(scope='session')
+def shared_tmproot() -> Generator[str, None, None]:
+    """
+    A temporary directory shared by the whole test session. Tests that need
+    scratch space should create their own subdirectory underneath it.
+    """
+    with TemporaryDirectory() as tempdir:
+        yield tempdir
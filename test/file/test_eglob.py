@@ -2,21 +2,27 @@
 from grizzled.file import eglob, touch
 import os
 from os import path
-from tempfile import TemporaryDirectory
+import shutil
+from tempfile import mkdtemp
 from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import pytest
 
-from typing import Sequence, Set, Generator
+from typing import Sequence, FrozenSet, Generator
 
 class Files(object):
+    __slots__ = ('tempdir', 'files', 'dirs', 'py_files', 'txt_files',
+                 'top_level_files', 'readmes')
+
     def __init__(self,
                  tempdir: str,
                  files: [str],
                  dirs: Sequence[str],
-                 py_files: Set[str],
-                 txt_files: Set[str],
-                 top_level_files: Set[str],
-                 readmes: Set[str]):
+                 py_files: FrozenSet[str],
+                 txt_files: FrozenSet[str],
+                 top_level_files: FrozenSet[str],
+                 readmes: FrozenSet[str]):
         self.tempdir = tempdir
         self.files = files
         self.dirs = dirs
@@ -25,9 +31,18 @@ class Files(object):
         self.top_level_files = top_level_files
         self.readmes = readmes
 
-@pytest.fixture
-def tempfiles() -> Generator[Files, None, None]:
-    with TemporaryDirectory() as tempdir:
+@contextmanager
+def scratch_directory(root: str) -> Generator[str, None, None]:
+    tempdir = mkdtemp(dir=root)
+    try:
+        yield tempdir
+    finally:
+        shutil.rmtree(tempdir)
+
+# The tests only read the tree, so one copy serves the whole module.
+@pytest.fixture(scope='module')
+def tempfiles(shared_tmproot: str) -> Generator[Files, None, None]:
+    with scratch_directory(shared_tmproot) as tempdir:
         foo = path.join(tempdir, "foo")
         bar = path.join(tempdir, "bar")
         baz = path.join(tempdir, "baz")
@@ -52,42 +67,62 @@ def tempfiles() -> Generator[Files, None, None]:
             path.join(tempdir, "license.txt"),
         )
 
-        py_files = { f for f in files if f.endswith(".py") }
-        readmes = { f for f in files if f.endswith("readme.txt") }
-        txt_files = { f for f in files if f.endswith(".txt") }
-        top_level_files = {
-            f for f in files if path.dirname(f) == tempdir
-        }
-
-        for d in dirs:
-            os.makedirs(d)
-
+        py_files = set()
+        readmes = set()
+        txt_files = set()
+        top_level_files = set()
         for f in files:
-            touch(f)
+            if f.endswith(".py"):
+                py_files.add(f)
+            if f.endswith(".txt"):
+                txt_files.add(f)
+                if f.endswith("readme.txt"):
+                    readmes.add(f)
+            if path.dirname(f) == tempdir:
+                top_level_files.add(f)
+
+        # Create all the directories concurrently, then all the files.
+        # (Nested directories are fine: with exist_ok, makedirs() tolerates
+        # a parent that another thread creates first.)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(partial(os.makedirs, exist_ok=True), dirs))
+            list(pool.map(touch, files))
 
         yield Files(tempdir=tempdir,
                     files=files,
                     dirs=dirs,
-                    py_files=py_files,
-                    readmes=readmes,
-                    txt_files=txt_files,
-                    top_level_files=top_level_files)
-
+                    py_files=frozenset(py_files),
+                    readmes=frozenset(readmes),
+                    txt_files=frozenset(txt_files),
+                    top_level_files=frozenset(top_level_files))
 
-def test_readme(tempfiles):
-    files = set(eglob("**/readme.txt", tempfiles.tempdir))
-    assert files == tempfiles.readmes
 
-def test_py_files(tempfiles):
-    files = set(eglob("**/*.py", tempfiles.tempdir))
-    assert files == tempfiles.py_files
+@pytest.mark.parametrize('pattern,attr', [
+    ("**/readme.txt", "readmes"),
+    ("**/*.py", "py_files"),
+    ("**/*.txt", "txt_files"),
+    ("*", "top_level_files"),
+])
+def test_eglob(tempfiles, pattern, attr):
+    files = set(eglob(pattern, tempfiles.tempdir))
+    if pattern == "*":
+        files = { f for f in files if os.path.isfile(f) }
+    assert files == getattr(tempfiles, attr)
 
-def test_text_files(tempfiles):
-    files = set(eglob("**/*.txt", tempfiles.tempdir))
-    assert files == tempfiles.txt_files
+def test_eglob_literal_ignores_case_like_glob(tempfiles, monkeypatch):
+    # On a case-insensitive file system, glob matches a name without
+    # wildcards in any case, and so must "**/name". Simulate one.
+    real_lexists = os.path.lexists
 
-def test_top_level_files(tempfiles):
-    top = set(eglob("*", tempfiles.tempdir))
-    files = { f for f in top if os.path.isfile(f) }
-    assert files == tempfiles.top_level_files
+    def lexists(p: str) -> bool:
+        d, name = path.split(p)
+        if real_lexists(p):
+            return True
+        if not path.isdir(d):
+            return False
+        return name.lower() in (f.lower() for f in os.listdir(d))
 
+    monkeypatch.setattr(os.path, 'lexists', lexists)
+    files = set(eglob("**/README.TXT", tempfiles.tempdir))
+    assert files == { path.join(path.dirname(f), "README.TXT")
+                      for f in tempfiles.readmes }
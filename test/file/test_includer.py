@@ -1,6 +1,5 @@
 import os
 from tempfile import TemporaryDirectory
-import codecs
 import logging
 from grizzled.file.includer import *
 from grizzled.os import working_directory
@@ -37,7 +36,7 @@ def test_simple(log):
         )
         for text, path in all:
             log.debug(f'writing "{path}"')
-            with codecs.open(path, mode='w', encoding='utf-8') as f:
+            with open(path, mode='w', encoding='utf-8') as f:
                 f.write(strip_margin(text))
 
         inc = Includer(outer_path)
@@ -76,7 +75,7 @@ def test_nested(log):
             (nested2, os.path.join(dir, "nested2.txt")),
         )
         for text, path in all:
-            with codecs.open(path, mode='w', encoding='utf-8') as f:
+            with open(path, mode='w', encoding='utf-8') as f:
                 f.write(strip_margin(text))
 
         inc = Includer(outer_path)
@@ -84,6 +83,87 @@ def test_nested(log):
         res = ''.join(lines)
         assert res == expected
 
+def test_nested_relative(log):
+    # A relative include inside an included file is resolved against that
+    # file's directory, not the outermost file's.
+    outer = '''|Outer line 1
+               |%include "sub/mid.txt"
+               |Outer line 2
+               |'''
+    mid = '''|Mid line 1
+             |%include "inner.txt"
+             |Mid line 2
+             |'''
+    top_inner = '''|Top-level inner line
+                   |'''
+    sub_inner = '''|Subdirectory inner line
+                   |'''
+    expected = strip_margin(
+        '''|Outer line 1
+           |Mid line 1
+           |Subdirectory inner line
+           |Mid line 2
+           |Outer line 2
+           |'''
+    )
+    with TemporaryDirectory() as dir:
+        os.makedirs(os.path.join(dir, "sub"))
+        outer_path = os.path.join(dir, "outer.txt")
+        all = (
+            (outer, outer_path),
+            (mid, os.path.join(dir, "sub", "mid.txt")),
+            (top_inner, os.path.join(dir, "inner.txt")),
+            (sub_inner, os.path.join(dir, "sub", "inner.txt")),
+        )
+        for text, path in all:
+            with open(path, mode='w', encoding='utf-8') as f:
+                f.write(strip_margin(text))
+
+        inc = Includer(outer_path)
+        res = ''.join([line for line in inc])
+        assert res == expected
+
+def test_repeated_include(log):
+    # The same file, included from two different files, must be expanded in
+    # full both times.
+    outer = '''|Outer line 1
+               |%include "inner.txt"
+               |%include "nested1.txt"
+               |Outer line 2
+               |'''
+    nested1 = '''|Nested 1 line 1
+                 |%include "inner.txt"
+                 |Nested 1 line 2
+                 |'''
+    inner = '''|Inner line 1
+               |Inner line 2
+               |'''
+    expected = strip_margin(
+        '''|Outer line 1
+           |Inner line 1
+           |Inner line 2
+           |Nested 1 line 1
+           |Inner line 1
+           |Inner line 2
+           |Nested 1 line 2
+           |Outer line 2
+           |'''
+    )
+    with TemporaryDirectory() as dir:
+        outer_path = os.path.join(dir, "outer.txt")
+        all = (
+            (outer, outer_path),
+            (nested1, os.path.join(dir, "nested1.txt")),
+            (inner, os.path.join(dir, "inner.txt")),
+        )
+        for text, path in all:
+            with open(path, mode='w', encoding='utf-8') as f:
+                f.write(strip_margin(text))
+
+        inc = Includer(outer_path)
+        res = ''.join([line for line in inc])
+        assert res == expected
+
 def test_overflow(log):
     outer = '''|First non-blank line.
                |Second non-blank line.
@@ -92,7 +172,7 @@ def test_overflow(log):
                |'''
     with TemporaryDirectory() as dir:
         outer_path = os.path.join(dir, "outer.txt")
-        with codecs.open(outer_path, mode='w', encoding='utf-8') as f:
+        with open(outer_path, mode='w', encoding='utf-8') as f:
             f.write(strip_margin(outer))
 
         try:
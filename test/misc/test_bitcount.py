@@ -3,12 +3,13 @@ from grizzled.misc import bitcount
 def test_bitcount():
     data = [
     # value      expected
-    (1000,         518),
+    (1000,         6),
     (2,            1),
     (3,            2),
     (10,           2),
     (0x00ff,       8),
-    (0x00efef00ac, 118361618),
+    (0x00efef00ac, 18),
+    (2**100 - 1,   100),
     ]
     for n, expected in data:
         v = bitcount(n)
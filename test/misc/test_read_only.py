@@ -10,12 +10,18 @@ from grizzled.misc import ReadOnly, ReadOnlyObjectError
 import pytest
 
 class Something(object):
+    __slots__ = ('a', 'b')
+
     def __init__(self, a=1, b=2):
         self.a = a
         self.b = b
 
-@pytest.fixture
+# A ReadOnly rejects every write, so the tests can safely share one.
+@pytest.fixture(scope='module')
 def readonly_something():
+    return ReadOnly(Something(11, 20))
+
+def test_setup_invariants():
     something = Something(10, 20)
     assert something.a == 10
     assert something.b == 20
@@ -23,19 +29,20 @@ def readonly_something():
     something.a += 1
     assert something.a == 11
 
-    return ReadOnly(something)
-
 def test_class_attr(readonly_something):
     assert readonly_something.__class__ is Something
 
 def test_is_instance(readonly_something):
     assert isinstance(readonly_something, Something)
 
-def test_access_1(readonly_something):
-    with pytest.raises(ReadOnlyObjectError):
-        readonly_something.a += 1
+def _augmented_assign(o):
+    o.a += 1
 
-def test_access_2(readonly_something):
-    with pytest.raises(ReadOnlyObjectError):
-        readonly_something.a = 200
+def _assign(o):
+    o.a = 200
 
+@pytest.mark.parametrize('mutate', [_augmented_assign, _assign],
+                         ids=['augmented', 'plain'])
+def test_access_raises(readonly_something, mutate):
+    with pytest.raises(ReadOnlyObjectError):
+        mutate(readonly_something)
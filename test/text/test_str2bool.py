@@ -7,22 +7,31 @@
 from grizzled.text import str2bool
 import pytest
 
-def test_good_strings():
-    for s, expected in (('false', False,),
-                        ('true',  True,),
-                        ('f',     False,),
-                        ('t',     True,),
-                        ('no',    False,),
-                        ('yes',   True,),
-                        ('n',     True,),
-                        ('y',     False,),
-                        ('0',     False,),
-                        ('1',     True,)):
-        for s2 in (s, s.upper(), s.capitalize()):
-            val = str2bool(s2)
-            assert val == expected
+_BASE_CASES = (('false', False,),
+               ('true',  True,),
+               ('f',     False,),
+               ('t',     True,),
+               ('no',    False,),
+               ('yes',   True,),
+               ('n',     False,),
+               ('y',     True,),
+               ('0',     False,),
+               ('1',     True,),
+               ('off',   False,),
+               ('on',    True,))
 
-def test_bad_strings():
-    for s in ('foo', 'bar', 'xxx', 'yyy', ''):
-        with pytest.raises(ValueError):
-            str2bool(s)
+# Each base case in lower, upper and capitalized form, built once at import.
+_CASES = tuple((variant, expected)
+               for s, expected in _BASE_CASES
+               for variant in (s, s.upper(), s.capitalize()))
+
+@pytest.mark.parametrize('s,expected', _CASES)
+def test_good_strings(s, expected):
+    assert str2bool(s) == expected
+
+_BAD_STRINGS = ('foo', 'bar', 'xxx', 'yyy', '')
+
+@pytest.mark.parametrize('s', _BAD_STRINGS)
+def test_bad_strings(s):
+    with pytest.raises(ValueError):
+        str2bool(s)
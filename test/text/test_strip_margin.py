@@ -1,26 +1,39 @@
 from grizzled.text import strip_margin
+import pytest
 
-def test_strip_margin():
-    assert strip_margin('''|abc
-                           |def
-                           |ghi''') == 'abc\ndef\nghi'
-    assert strip_margin('''|abc
-                           |def
-                           |ghi
-                           ''') == 'abc\ndef\nghi\n'
-    assert strip_margin('''|abc
-                           |def
-                           |ghi
-                           |''') == 'abc\ndef\nghi\n'
-    assert strip_margin('''|abc
-                           |
-                           |ghi
-                           |''') == 'abc\n\nghi\n'
-    assert strip_margin('''|abc
+# (input, expected) pairs for the default margin character.
+_CASES = (
+    ('''|abc
+        |def
+        |ghi''', 'abc\ndef\nghi'),
+    ('''|abc
+        |def
+        |ghi
+        ''', 'abc\ndef\nghi\n'),
+    ('''|abc
+        |def
+        |ghi
+        |''', 'abc\ndef\nghi\n'),
+    ('''|abc
+        |
+        |ghi
+        |''', 'abc\n\nghi\n'),
+    ('''|abc
 
-                           |ghi
-                           |''') == 'abc\n\nghi\n'
-    assert strip_margin('''|abc
-                           oops
-                           |ghi
-                           |''') == 'abc\noops\nghi\n'
+        |ghi
+        |''', 'abc\n\nghi\n'),
+    ('''|abc
+        oops
+        |ghi
+        |''', 'abc\noops\nghi\n'),
+)
+
+@pytest.mark.parametrize('s,expected', _CASES)
+def test_strip_margin(s, expected):
+    assert strip_margin(s) == expected
+
+def test_strip_margin_custom_char():
+    assert strip_margin('''#abc
+                           #|def
+                           ghi
+                           #''', margin_char='#') == 'abc\n|def\nghi\n'